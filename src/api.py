@@ -39,7 +39,8 @@ def get_workflow() -> QueryWorkflow:
     return workflow
 
 @app.on_event("shutdown")
-def shutdown_event():
+async def shutdown_event():
+    await runtime.provider_manager.aclose()
     runtime.db.close()
 
 # API Routes
@@ -97,7 +98,7 @@ async def get_providers():
 async def get_stations(provider: str):
     """Get list of available stations for a given provider."""
     try:
-        provider_handler = runtime.provider_manager.get_provider(provider.lower())
+        provider_handler = runtime.provider_manager.get_provider(provider)
         if provider_handler is None:
             raise ValueError(f"Unknown provider {provider.lower()}. Check /providers endpoint for available providers.")
         async with provider_handler as prv:
@@ -139,7 +140,7 @@ async def query_timeseries_get(
         workflow: QueryWorkflow = Depends(get_workflow),
     ):
 
-    provider_handler = runtime.provider_manager.get_provider(provider.lower())
+    provider_handler = runtime.provider_manager.get_provider(provider)
     if provider_handler is None:
         raise HTTPException(status_code=400, detail=f"No provider named {provider} found. Choose one of {runtime.provider_manager.list_providers()}")
 
@@ -191,6 +192,7 @@ async def query_timeseries_get(
             latest=latest,
             agg=agg,
             min_size=min_size,
+            provider_handler=provider_handler,
         )
         if pending is not None and not pending.empty and not latest:
             if provider_handler.cache_data:
@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 
 from . import models
 from ..meteo.base import BaseMeteoHandler
+from ..utils import same_timezone
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,9 @@ class MeteoDB:
     def __init__(self, engine: str = 'sqlite:///database.db'):
         self.engine = create_engine(engine)
         models.Base.metadata.create_all(self.engine)
+        # create_all skips tables that already exist, so indexes added later have to be created explicitly
+        for index in models.Measurement.__table__.indexes:
+            index.create(self.engine, checkfirst=True)
         self.Session = sessionmaker(
             bind=self.engine,
             autocommit=False,
@@ -167,7 +171,9 @@ class MeteoDB:
 
         if not df.empty:
             try:
-                df['datetime'] = df['datetime'].dt.tz_localize(timezone.utc).dt.tz_convert(orig_timezone)
+                df['datetime'] = df['datetime'].dt.tz_localize(timezone.utc)
+                if not same_timezone(timezone.utc, orig_timezone):
+                    df['datetime'] = df['datetime'].dt.tz_convert(orig_timezone)
             except Exception as e:
                 logger.warning(f"Could not convert timezone back to {orig_timezone}: {e}. Keeping UTC timezone.")
                 # Ensure index is UTC-aware if conversion fails
@@ -1,5 +1,5 @@
 from sqlalchemy import (
-    Column, Integer, Float, String, ForeignKey, DateTime, Text, UniqueConstraint
+    Column, Integer, Float, String, ForeignKey, DateTime, Text, UniqueConstraint, Index
 )
 from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import declarative_base, relationship
@@ -47,4 +47,8 @@ class Measurement(Base):
     station = relationship("Station", back_populates="measurements")
     variable = relationship("Variable", back_populates="measurements")
 
-    __table_args__ = (UniqueConstraint("station_id", "variable_id", "datetime", "model"), )
\ No newline at end of file
+    __table_args__ = (
+        UniqueConstraint("station_id", "variable_id", "datetime", "model"),
+        # query_data filters a station by datetime range, which the unique constraint above cannot serve past station_id
+        Index("ix_measurements_station_datetime", "station_id", "datetime"),
+    )
\ No newline at end of file
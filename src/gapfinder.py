@@ -1,12 +1,14 @@
 import pandas as pd
-from pandas.tseries.frequencies import to_offset
+import numpy as np
 from pandas.api.types import is_datetime64_any_dtype
 
 import logging
-from datetime import datetime, timezone, tzinfo
+from datetime import datetime, tzinfo
 
 from typing import List, Tuple
 
+from .utils import floor_to_freq, freq_to_timedelta
+
 logger = logging.getLogger(__name__)
 
 class Gapfinder:
@@ -16,8 +18,8 @@ class Gapfinder:
 
     def _build_daterange(self, start: datetime, end: datetime, freq: str, inclusive: str):
 
-        start_time_aligned = pd.Timestamp(start).floor(freq)
-        end_time_aligned = pd.Timestamp(end).floor(freq)
+        start_time_aligned = floor_to_freq(start, freq)
+        end_time_aligned = floor_to_freq(end, freq)
 
         return pd.date_range(
             start=start_time_aligned,
@@ -28,10 +30,9 @@ class Gapfinder:
 
     def _delta_from_freq(self, freq: str):
         try:
-            offset = to_offset(freq)
+            return freq_to_timedelta(freq)
         except Exception as e:
             raise ValueError(f"Invalid frequency '{freq}': {e}")
-        return pd.Timedelta(offset)
 
     def find_data_gaps(
         self,
@@ -65,10 +66,11 @@ class Gapfinder:
             raise ValueError(f"end must be >= start. Got {end} < {start}")
 
         try:
-            min_gap_duration = pd.Timedelta(min_gap_duration)
+            min_gap_duration = pd.Timedelta(min_gap_duration).as_unit('ns')
             freq_delta = self._delta_from_freq(freq)
 
-            complete_ts = self._build_daterange(start, end, freq, inclusive)
+            # Work in ns throughout, as Timedelta.value is always ns while pandas may pick a coarser unit for the daterange
+            complete_ts = self._build_daterange(start, end, freq, inclusive).as_unit('ns')
 
             if complete_ts.empty:
                 return []
@@ -81,36 +83,44 @@ class Gapfinder:
                     raise ValueError("Naive existing_dates are not allowed without an explicit timezone")
                 existing_dates = existing_dates.tz_localize(tz)
 
-            target_tz = start.tzinfo or timezone.utc
-            if existing_dates.tz != target_tz:
-                existing_dates = existing_dates.tz_convert(target_tz)
-
-            existing_dates = existing_dates.sort_values().unique()
-            missing_ts = complete_ts.difference(existing_dates)
+            # Set difference on the int64 epoch values, which are UTC based whatever the timezone of either index,
+            # so no tz conversion is needed. Units are aligned first, since cached dates may not be in ns
+            complete_i8 = complete_ts.asi8
+            if existing_dates.is_monotonic_increasing:
+                # Sorted merge: a timestamp is missing if the existing value at its insertion point differs.
+                # Duplicates do not matter here, so no unique() is needed either
+                existing_i8 = existing_dates.as_unit('ns').asi8
+                positions = np.minimum(np.searchsorted(existing_i8, complete_i8), len(existing_i8) - 1)
+                missing_i8 = complete_i8[existing_i8[positions] != complete_i8]
+            else:
+                # setdiff1d sorts internally and only needs unique inputs, so cached dates without duplicates are not copied
+                if not existing_dates.is_unique:
+                    existing_dates = existing_dates.unique()
+                missing_i8 = np.setdiff1d(complete_i8, existing_dates.as_unit('ns').asi8, assume_unique=True)
+            missing_ts = pd.DatetimeIndex(missing_i8, dtype=complete_ts.dtype)
 
             if missing_ts.empty:
                 return []
 
-            gaps = []
-            for gap_start, gap_end in self.derive_datetime_gaps(missing_ts.tolist(), freq=freq):
-
-                coverage = (pd.Timestamp(gap_end) + freq_delta) - pd.Timestamp(gap_start)
-
-                if coverage >= min_gap_duration:
-                    gaps.append((gap_start, gap_end))
+            # Gap lengths are compared on the int64 ns values, without building Timedeltas
+            tick = freq_delta.value
+            starts, ends = self._run_bounds(missing_i8, tick)
+            coverage = missing_i8[ends] - missing_i8[starts] + tick
+            keep = coverage >= min_gap_duration.value
+            starts, ends = starts[keep], ends[keep]
 
-            return gaps
+            return list(zip(missing_ts[starts].to_pydatetime(), missing_ts[ends].to_pydatetime()))
 
         except Exception:
             logger.exception("Error finding data gaps")
             return [(start, end)]  # Return full range as gap on error
 
-    def derive_datetime_gaps(self, timestamps: list[datetime] | None, freq: str):
+    def derive_datetime_gaps(self, timestamps: list[datetime] | pd.DatetimeIndex | None, freq: str):
         """
         Groups a list of timestamp objects into consecutive gaps based on the given frequency.
 
         Parameters:
-            timestamps (list): A list of datetime objects representing the missing timestamps in a series.
+            timestamps (list | pd.DatetimeIndex): The missing timestamps in a series.
             freq (str): The frequency string (e.g., 'D', 'H', 'T') of the original timeseries.
 
         Returns:
@@ -118,34 +128,28 @@ class Gapfinder:
                 Each tuple contains Python datetime.datetime objects.
         """
 
-        if not timestamps:
+        if timestamps is None or len(timestamps) == 0:
             return []
 
-        # Normalize timestamps to pandas.Timestamp for reliable arithmetic/comparison
-        pd_timestamps = [pd.Timestamp(ts) for ts in timestamps]
-        pd_timestamps.sort()
+        ts_index = pd.DatetimeIndex(timestamps).as_unit('ns')
+        # Missing timestamps from find_data_gaps are already sorted, only sort other input
+        if not ts_index.is_monotonic_increasing:
+            ts_index = ts_index.sort_values()
+        tick_ns = self._delta_from_freq(freq).value
 
-        # Convert frequency string to a Timedelta/offset
-        freq_delta = self._delta_from_freq(freq)
+        starts, ends = self._run_bounds(ts_index.asi8, tick_ns)
+        return list(zip(ts_index[starts].to_pydatetime(), ts_index[ends].to_pydatetime()))
 
-        gaps = []
-        gap_start = pd_timestamps[0]
-        gap_end = pd_timestamps[0]
-
-        for current_ts in pd_timestamps[1:]:
-            expected_next = gap_end + freq_delta
-            if current_ts == expected_next:
-                # consecutive, extend current gap
-                gap_end = current_ts
-            else:
-                # non-consecutive, close current gap and start a new one
-                gaps.append((gap_start.to_pydatetime(), gap_end.to_pydatetime()))
-                gap_start = current_ts
-                gap_end = current_ts
-
-        # append the final gap
-        gaps.append((gap_start.to_pydatetime(), gap_end.to_pydatetime()))
-        return gaps
+    @staticmethod
+    def _run_bounds(values: np.ndarray, tick: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Positions of the first and last element of every run of sorted int64 values spaced exactly one tick apart.
+        """
+        # A new gap starts wherever the distance to the previous timestamp is not exactly one step
+        breaks = np.flatnonzero(np.diff(values) != tick) + 1
+        starts = np.concatenate(([0], breaks))
+        ends = np.concatenate((breaks - 1, [len(values) - 1]))
+        return starts, ends
 
     # def validate_date(self, date, target_format = "%d.%m.%Y"):
     #     ##Validate input dates
@@ -7,6 +7,7 @@ import logging
 import datetime
 import numpy as np
 import re
+import time
 from typing import Any, Dict, List, Tuple
 import pytz
 from pathlib import Path
@@ -36,6 +37,45 @@ SBR_RENAME = {
         "rainStart": "rain_start"
 }
 
+def _get_accept_encoding() -> str:
+    """
+    Only advertise compressions that httpx can decode with the installed optional packages.
+    Brotli roughly halves the size of the dataset page compared to gzip.
+    """
+    encodings = []
+    try:
+        import zstandard  # noqa: F401
+        encodings.append("zstd")
+    except ImportError:
+        pass
+    try:
+        import brotli  # noqa: F401
+        encodings.append("br")
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            encodings.append("br")
+        except ImportError:
+            logger.debug("Neither brotli nor brotlicffi is installed. SBR responses will be requested with gzip compression.")
+    encodings.extend(["gzip", "deflate"])
+    return ", ".join(encodings)
+
+_ACCEPT_ENCODING = _get_accept_encoding()
+
+# Dataset embedded as javascript in the html response of the timeseries page
+_SBR_DATASET_PATTERN = re.compile(r"let\s+dataSetOnLoad\s*=\s*prepareDataset\(\[\[(\{.*?\})\]\]", re.DOTALL)
+
+# Range of epoch seconds that fit into a datetime64[ns] array
+_MIN_EPOCH_SECONDS = pd.Timestamp.min.value // 10**9 + 1
+_MAX_EPOCH_SECONDS = pd.Timestamp.max.value // 10**9
+
+# Maps raw measurement ids (mg4, mg12, ...) to their german abbreviations used in SBR_RENAME
+_SBR_KUERZEL = {k: v['kuerzel_de'] for k, v in sbr_colmap.items()}
+
+# Raw measurement ids grouped by target dtype, used by _assign_dtype
+_SBR_FLOAT_COLS = frozenset(k for k, v in sbr_colmap.items() if v['einheit'] in ("mm", "degC", "%", "m*s-1"))
+_SBR_INT_COLS = frozenset(k for k, v in sbr_colmap.items() if v['einheit'] == "Ein/Aus")
+
 _QUEUE_SENTINEL = object()
 
 class SBRMeteo(BaseMeteoHandler):
@@ -59,10 +99,14 @@ class SBRMeteo(BaseMeteoHandler):
     _DROP_COLUMNS = ['mg20', 'mg28', 'create_time', 'Ausf.'] #these columns will be dropped from dataframe. Use original names before applying SBR_rename
 
 
-    def __init__(self, username: str, password: str, **kwargs):
+    def __init__(self, username: str, password: str, login_max_age_minutes: int = 60, **kwargs):
         super().__init__(**kwargs)
         self.username = username
         self.password = password
+        self.login_max_age_minutes = login_max_age_minutes
+
+        self._logged_in_at = None
+        self._login_lock = asyncio.Lock()
 
         if self.timezone != 'Europe/Rome':
             raise ValueError("SBRMeteo timezone has to be Europe/Rome as query-url expects the dates in this timezone.")
@@ -90,11 +134,61 @@ class SBRMeteo(BaseMeteoHandler):
     def get_freq(self, models: list[str] | None = None):
         return "5min"
 
+    def _create_client(self) -> httpx.AsyncClient:
+        # Retry failed connection attempts on the pooled transport instead of dropping the whole chunk.
+        # Keep one warm connection per concurrent request so chunks never wait for a new TLS handshake.
+        limits = httpx.Limits(
+            max_connections = self.max_concurrent_requests,
+            max_keepalive_connections = self.max_concurrent_requests,
+            keepalive_expiry = max(30, self.sleep_time * 2),
+        )
+        transport = httpx.AsyncHTTPTransport(retries = 3, limits = limits)
+        return httpx.AsyncClient(timeout = self.timeout, transport = transport)
+
     @property
     def inclusive(self):
         return 'both'
 
     async def _authenticate(self):
+        """
+        Login is deferred until data is requested, as station info and station lists are served from a local file.
+        A new client starts without session cookies, so the previous login is invalidated.
+        """
+        self._logged_in_at = None
+
+    async def _ensure_logged_in(self):
+        """
+        Log in to SBR website if the client has no session yet or the last login is older than login_max_age_minutes
+        """
+        async with self._login_lock:
+            if (
+                self._logged_in_at is not None
+                and time.monotonic() - self._logged_in_at < self.login_max_age_minutes * 60
+            ):
+                return
+            await self._login()
+            self._logged_in_at = time.monotonic()
+
+    async def _refresh_login(self, login_time: float | None):
+        """
+        Log in again after the server dropped the session. login_time is the login the failed request was sent with,
+        so concurrent workers that hit the same expired session only trigger a single new login.
+        """
+        async with self._login_lock:
+            if self._logged_in_at is not None and self._logged_in_at != login_time:
+                return
+            self._logged_in_at = None
+            await self._login()
+            self._logged_in_at = time.monotonic()
+
+    @staticmethod
+    def _session_expired(text: str) -> bool:
+        """
+        Check if a timeseries page came back as the login page, i.e. the session is no longer valid.
+        """
+        return "Logindaten vergessen" in text
+
+    async def _login(self):
         """
         Log in to SBR website
         """
@@ -174,7 +268,13 @@ class SBRMeteo(BaseMeteoHandler):
     async def get_sensors(self, station_id: str):
         return list(SBR_RENAME.keys())
 
-    async def _worker(self, queue: asyncio.Queue, results: list[pd.DataFrame]):
+    async def _worker(
+        self,
+        queue: asyncio.Queue,
+        station_id: int,
+        data_type: str,
+        results: dict[int, List[Dict[str, Any]]],
+    ):
         while True:
             item = await queue.get()
             if item is _QUEUE_SENTINEL:
@@ -182,17 +282,25 @@ class SBRMeteo(BaseMeteoHandler):
                 break
             
             try:
-                if item['success']:
-                    rows = self._extract_data_from_response(item['data'])
+                # Parse each page right after download so its html can be released before the next request
+                login_time = self._logged_in_at
+                response = await self._request_data(station_id, item['date_range'], data_type, chunk = item['chunk'])
+                if response['success'] and self._session_expired(response['data']):
+                    # Retry the chunk once with a new login, otherwise the gap would be cached as missing data
+                    logger.info(f"SBR session is no longer valid. Logging in again and retrying chunk {item['chunk']}")
+                    await self._refresh_login(login_time)
+                    response = await self._request_data(station_id, item['date_range'], data_type, chunk = item['chunk'])
+                if response['success']:
+                    rows = self._extract_data_from_response(response['data'])
                     if rows:
-                        results.append(self._get_formatted_tbl(rows))
+                        results[item['chunk']] = rows
             except Exception as e:
                 logger.error(f"Error extracting data: {e}", exc_info=True)
             finally:
                 queue.task_done()
 
     async def _request_data(
-        self, station_id: str, date_range: Tuple[datetime, datetime], data_type
+        self, station_id: str, date_range: Tuple[datetime, datetime], data_type, chunk: int = 0
         ):
 
         if self._client is None:
@@ -203,7 +311,7 @@ class SBRMeteo(BaseMeteoHandler):
             data_headers = {
                 "User-Agent": self.user_agent,
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-                "Accept-Encoding": "gzip, deflate, br, zstd",
+                "Accept-Encoding": _ACCEPT_ENCODING,
                 "Accept-Language": "en-US,en;q=0.9"
             }
             data_params = {
@@ -226,25 +334,18 @@ class SBRMeteo(BaseMeteoHandler):
                 response.raise_for_status()
                 await asyncio.sleep(self.sleep_time)
             
-            return {'success': True, 'data': response.text}
+            return {'success': True, 'data': response.text, 'chunk': chunk}
         except Exception as e:
             logger.error(f"Error fetching data for {start_date} - {end_date}: {e}", exc_info = True)
-            return {'success': False, 'data': None}
+            return {'success': False, 'data': None, 'chunk': chunk}
 
     async def _producer(
         self,
         queue: asyncio.Queue,
-        station_id: int,
         dates_split: list[Tuple[datetime.datetime, datetime.datetime]],
-        data_type: str,
     ):
-        tasks = [
-            asyncio.create_task(self._request_data(station_id, date_range, data_type))
-            for date_range in dates_split
-        ]
-        for task in asyncio.as_completed(tasks):
-            result = await task
-            await queue.put(result)
+        for i, date_range in enumerate(dates_split):
+            await queue.put({'chunk': i, 'date_range': date_range})
 
     async def get_raw_data(
             self,
@@ -290,14 +391,18 @@ class SBRMeteo(BaseMeteoHandler):
 
         dates_split = split_dates(start, end, freq = self.get_freq(), n_days=self.chunk_size_days)
 
-        # Start workers
-        raw_responses = []
-        worker_count = max(int(self.max_concurrent_requests/2), 1)
-        workers = [asyncio.create_task(self._worker(queue, results = raw_responses)) for _ in range(worker_count)]
+        await self._ensure_logged_in()
+
+        # Start workers. Parsed rows are keyed by chunk so the result keeps the chronological order of dates_split
+        # Each worker downloads and parses one chunk at a time, so at most worker_count html pages are held in memory
+        raw_responses = {}
+        worker_count = max(min(self.max_concurrent_requests, len(dates_split)), 1)
+        workers = [
+            asyncio.create_task(self._worker(queue, request_station_id, data_type, results = raw_responses))
+            for _ in range(worker_count)
+        ]
         
-        producer = asyncio.create_task(
-            self._producer(queue, request_station_id, dates_split, data_type)
-        )
+        producer = asyncio.create_task(self._producer(queue, dates_split))
 
         await producer
         await queue.join()
@@ -309,7 +414,9 @@ class SBRMeteo(BaseMeteoHandler):
 
         st_metadata = await self.get_station_info(station_id)
         if len(raw_responses) > 0:
-            return pd.concat(raw_responses, ignore_index = True), st_metadata
+            # Format all chunks as one table so dtype and timestamp conversions run once instead of per chunk plus a concat
+            all_rows = [row for i in sorted(raw_responses) for row in raw_responses[i]]
+            return self._get_formatted_tbl(all_rows), st_metadata
         else:
             logger.warning(f"No data could be fetched for station {station_id}")
             return None, st_metadata
@@ -344,37 +451,54 @@ class SBRMeteo(BaseMeteoHandler):
     def _extract_data_from_response(
         self,
         text: str,
-        pattern: str = r"let\s+dataSetOnLoad\s*=\s*prepareDataset\(\[\[(\{.*?\})\]\]",
+        pattern: str | re.Pattern = _SBR_DATASET_PATTERN,
         n_group: int = 1,
-    ) -> List[Dict[str, str]]:
+    ) -> List[Dict[str, Any]]:
         """
         Extracts data from the HTML response text based on a given pattern.
+        The matched dataset is parsed as JSON, so numeric values keep their native type.
 
         Args:
             text (str): The HTML response text.
-            pattern (str): The regex pattern to search for.
+            pattern (str | re.Pattern): The regex pattern to search for. Strings are compiled with re.DOTALL.
             n_group (int): The group number to extract from the regex match.
             
         Returns:
-            List[Dict[str, str]]: A list of dictionaries, where each dictionary represents a row of data.
+            List[Dict[str, Any]]: A list of dictionaries, where each dictionary represents a row of data.
         """
-        p_match = re.search(pattern, text, re.DOTALL)
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern, re.DOTALL)
+
+        p_match = pattern.search(text)
         if not p_match:
-            logger.warning(f"Could not find pattern {pattern} in the text.")
+            logger.warning(f"Could not find pattern {pattern.pattern} in the text.")
             return []
 
         text = p_match.group(n_group)
+        try:
+            data = json.loads(f"[{text}]")
+        except json.JSONDecodeError as e:
+            logger.debug(f"Dataset is not valid JSON ({e}). Falling back to manual parsing.")
+            return self._split_dataset_rows(text)
+
+        return [row for row in data if isinstance(row, dict) and row]
+
+    def _split_dataset_rows(self, text: str) -> List[Dict[str, str]]:
+        """
+        Fallback parser for dataset payloads that are not valid JSON. Splits the
+        object literals manually and keeps all values as raw strings.
+        """
         data = [i.strip('}').strip('{').split(',') for i in text.split('},{')]
 
         rows = []
         for n in data:
-            try:
-                row = {j.split(':')[0]: j.split(':')[1] for j in n if ':' in j}
-                if row:  # Only add non-empty rows
-                    rows.append(row)
-            except Exception as e:
-                logger.warning(f"Error parsing row data: {e}")
-                continue
+            row = {}
+            for field in n:
+                key, sep, value = field.partition(':')
+                if sep:
+                    row[key] = value
+            if row:  # Only add non-empty rows
+                rows.append(row)
                 
         return rows
 
@@ -388,26 +512,51 @@ class SBRMeteo(BaseMeteoHandler):
         Returns:
             pd.DataFrame: DataFrame with corrected data types
         """
-        tbl_re = tbl.copy()
-        for col in tbl_re.columns:
-            try:
-                unit = sbr_colmap.get(col, {'einheit': ''})['einheit']
+        # normalize null-ish sentinels
+        tbl_re = tbl.replace({"null": np.nan, "NULL": np.nan, None: np.nan})
 
-                # normalize null-ish sentinels
-                tbl_re[col] = tbl_re[col].replace({"null": np.nan, "NULL": np.nan, None: np.nan})
+        dtype_map = {
+            col: "float64" if col in _SBR_FLOAT_COLS else "Int64" if col in _SBR_INT_COLS else str
+            for col in tbl_re.columns
+        }
 
-                if unit in ["mm", "degC", "%", "m*s-1"]:
-                    tbl_re[col] = pd.to_numeric(tbl_re[col], errors="coerce").astype("float64")
-                elif unit == "Ein/Aus":
-                    tbl_re[col] = pd.to_numeric(tbl_re[col], errors="coerce").astype("Int64")
-                else:
-                    tbl_re[col] = tbl_re[col].astype(str)
+        # Only columns that did not arrive as numbers need to be parsed
+        parse_columns = [
+            col for col, dtype in dtype_map.items()
+            if dtype is not str and not pd.api.types.is_numeric_dtype(tbl_re[col])
+        ]
+        if parse_columns:
+            tbl_re[parse_columns] = tbl_re[parse_columns].apply(pd.to_numeric, errors="coerce")
+
+        # On/off columns must hold whole numbers to be cast to Int64, any other value is treated as missing
+        int_columns = [col for col, dtype in dtype_map.items() if dtype == "Int64"]
+        if int_columns:
+            tbl_re[int_columns] = tbl_re[int_columns].where(tbl_re[int_columns] % 1 == 0)
+
+        try:
+            return tbl_re.astype(dtype_map)
+        except Exception as e:
+            logger.debug(f"Bulk dtype assignment failed ({e}). Assigning dtypes per column.")
+
+        for col, dtype in dtype_map.items():
+            try:
+                tbl_re[col] = tbl_re[col].astype(dtype)
             except Exception as e:
                 logger.warning(f"Error assigning dtype of column {col}: {e}")
                 
         return tbl_re
 
-    def _get_formatted_tbl(self, rows: List[Dict[str, str]]) -> pd.DataFrame:
+    @staticmethod
+    def _epoch_to_utc(values: pd.Series) -> pd.DatetimeIndex:
+        """Convert epoch seconds to a UTC DatetimeIndex in ns resolution. Invalid entries become NaT."""
+        seconds = pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        # Epochs outside the ns-representable range would overflow to garbage dates on the cast below
+        valid = (seconds >= _MIN_EPOCH_SECONDS) & (seconds <= _MAX_EPOCH_SECONDS)
+        ts_arr = np.full(seconds.shape, np.datetime64("NaT"), dtype="datetime64[ns]")
+        ts_arr[valid] = seconds[valid].astype("int64").astype("datetime64[s]")
+        return pd.DatetimeIndex(ts_arr, tz="UTC")
+
+    def _get_formatted_tbl(self, rows: List[Dict[str, Any]]) -> pd.DataFrame:
         """
         Formats the extracted data into a pandas DataFrame.
 
@@ -420,10 +569,13 @@ class SBRMeteo(BaseMeteoHandler):
         if not rows:
             return pd.DataFrame()
             
-        tbl = pd.DataFrame.from_dict(rows)
-        tbl.rename(columns=lambda x: x.strip('"'), inplace=True)
+        # Rows parsed from JSON carry native numbers, so numeric columns are inferred
+        # while building the frame and _assign_dtype only has to cast them.
+        tbl = pd.DataFrame.from_records(rows)
+        if any(str(col).startswith('"') for col in tbl.columns):
+            tbl.rename(columns=lambda x: x.strip('"'), inplace=True)
         tbl = self._assign_dtype(tbl)
-        tbl.rename(columns=lambda x: sbr_colmap[x]['kuerzel_de'] if x in sbr_colmap.keys() else x, inplace=True)
+        tbl.rename(columns=_SBR_KUERZEL, inplace=True)
         tbl.rename(columns={'x': 'Datum'}, inplace=True)
 
         # Handle column conversions with error handling
@@ -446,12 +598,8 @@ class SBRMeteo(BaseMeteoHandler):
         if datetime_columns:
             datetime_name = datetime_columns[0]
             try:
-                numeric_ts = pd.to_numeric(tbl[datetime_name], errors="coerce")
-                tbl[datetime_name] = (
-                    pd.to_datetime(numeric_ts, unit="s", errors="coerce")
-                    .dt.tz_localize("UTC") ##timestamp in html is in UTC!
-                    .dt.floor(self.get_freq())
-                )
+                ##timestamp in html is in UTC!
+                tbl[datetime_name] = self._epoch_to_utc(tbl[datetime_name]).floor(self.get_freq())
                 tbl.rename(columns={datetime_name: "Datum"}, inplace=True)
             except Exception as e:
                 logger.warning(f"Error converting Datum: {e}")
@@ -466,11 +614,7 @@ class SBRMeteo(BaseMeteoHandler):
         if create_time_column:
             create_time_name = create_time_column[0]
             try:
-                numeric_ct = pd.to_numeric(tbl[create_time_name], errors="coerce")
-                tbl[create_time_name] = (
-                    pd.to_datetime(numeric_ct, unit="s", errors="coerce")
-                    .dt.tz_localize("UTC")
-                )
+                tbl[create_time_name] = self._epoch_to_utc(tbl[create_time_name])
                 tbl.rename(columns={create_time_name: "create_time"}, inplace=True)
             except Exception as e:
                 logger.warning(f"Error converting create_time: {e}")
@@ -480,9 +624,12 @@ class SBRMeteo(BaseMeteoHandler):
 
         try:
             if 'rainStart' in tbl.columns:
-                tbl['rainStart'] = tbl['rainStart'].apply(lambda x: x.strip('"') if pd.notna(x) else x)
-                tbl['rainStart'] = pd.to_datetime(tbl['rainStart'], format='%Y-%m-%d %H', errors='coerce')
-                tbl['rainStart'] = tbl['rainStart'].dt.tz_localize(tz = self.timezone).dt.tz_convert('UTC')
+                # rainStart is naive local time; hours skipped or repeated by DST switches must not fail the whole column
+                tbl['rainStart'] = (
+                    pd.to_datetime(tbl['rainStart'].str.strip('"'), format='%Y-%m-%d %H', errors='coerce')
+                    .dt.tz_localize(self.timezone, nonexistent='shift_forward', ambiguous='NaT')
+                    .dt.tz_convert('UTC')
+                )
         except Exception as e:
             logger.warning(f"Error converting rainStart: {e}")
 
@@ -517,6 +664,7 @@ if __name__ == "__main__":
                 start = start,
                 end = end,
             )
+        await sbr_handler.aclose()
         print(data)
         return data
 
@@ -4,6 +4,8 @@ import httpx
 from abc import ABC, abstractmethod
 import pandas as pd
 import pandera.pandas as pa
+from pandera.engines import pandas_engine
+import re
 from typing import Any, Dict, Tuple
 import logging
 
@@ -19,6 +21,13 @@ class BaseMeteoHandler(ABC):
 
     can_forecast = False
 
+    # Providers that answer a whole range with a constant number of requests can
+    # fetch several data gaps with a single call over the enclosing range
+    supports_batch = False
+
+    # Upper bound on failure cases collected per check and logged per failed validation
+    _MAX_FAILURE_CASES = 50
+
     def __init__(
         self, 
         timezone: str, 
@@ -29,6 +38,7 @@ class BaseMeteoHandler(ABC):
         latest_window_minutes: int = 60,
         forecast_window_minutes: int | None = None,
         cache_data: bool = False,
+        fast_validate: bool = False,
         **kwargs
         ):
         
@@ -44,6 +54,7 @@ class BaseMeteoHandler(ABC):
         self.latest_window_minutes = latest_window_minutes
         self.forecast_window_minutes = forecast_window_minutes or latest_window_minutes
         self.cache_data = cache_data
+        self.fast_validate = fast_validate
         
         self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
         self.station_info = None
@@ -51,6 +62,7 @@ class BaseMeteoHandler(ABC):
         self.station_sensors = {}
         self._station_sensors_locks: dict[str, asyncio.Lock] = {}
         self._client = None
+        self._client_lock = asyncio.Lock()
         self._initialize_lock = asyncio.Lock()
         self._initialized = False
 
@@ -90,18 +102,30 @@ class BaseMeteoHandler(ABC):
     async def _initialize(self):
         pass
 
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create the httpx client used for all requests of this handler. Override to customize transport settings."""
+        return httpx.AsyncClient(timeout = self.timeout)
+
     async def __aenter__(self):
-        """Start httpx client that is reused across requests"""
-        logger.debug("Opening API session...")
-        self._client = httpx.AsyncClient(timeout = self.timeout)
-        await self._authenticate()
+        """Start httpx client on first use. The client stays open and is shared by all later and concurrent contexts."""
+        async with self._client_lock:
+            if self._client is None or self._client.is_closed:
+                logger.debug("Opening API session...")
+                self._client = self._create_client()
+                await self._authenticate()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Start httpx client that is reused across requests"""
-        logger.debug("Closing API session...")
-        if self._client is not None:
-            await self._client.aclose()
+        """Keep the httpx client open, so pooled connections are reused by the next request. Use aclose on shutdown."""
+        pass
+
+    async def aclose(self):
+        """Close the httpx client and its pooled connections."""
+        async with self._client_lock:
+            if self._client is not None:
+                logger.debug("Closing API session...")
+                await self._client.aclose()
+                self._client = None
 
     @abstractmethod
     async def get_sensors(self, station_id: str) -> list[str]:
@@ -157,6 +181,31 @@ class BaseMeteoHandler(ABC):
 
     @property
     def output_schema(self) -> pa.DataFrameSchema:
+        """
+        Expected schema for the meteorological data output. Built once per handler class
+        and shared by all of its instances.
+        
+        Returns:
+            pa.DataFrameSchema: Schema for validating output data
+        """
+        cls = type(self)
+        schema = cls.__dict__.get("_output_schema_cache")
+        if schema is None:
+            schema = self._build_output_schema()
+            cls._output_schema_cache = schema
+        return schema
+
+    @property
+    def schema_columns(self) -> frozenset[str]:
+        """Column names declared in the output schema, cached on the handler class together with the schema."""
+        cls = type(self)
+        columns = cls.__dict__.get("_schema_cols")
+        if columns is None:
+            columns = frozenset(self.output_schema.columns)
+            cls._schema_cols = columns
+        return columns
+
+    def _build_output_schema(self) -> pa.DataFrameSchema:
         """
         Define the expected schema for SBR meteorological data output.
         
@@ -173,19 +222,19 @@ class BaseMeteoHandler(ABC):
                 "tsoil_25cm": pa.Column(float, nullable=True, required=False, coerce = True),     # Soil temperature -25cm
                 "tdry_60cm": pa.Column(float, nullable=True, required=False, coerce = True),           # Dry temperature 60cm
                 "twet_60cm": pa.Column(float, nullable=True, required=False, coerce = True),           # Wet temperature
-                "relative_humidity": pa.Column(float, pa.Check.between(0, 100), nullable=True, required=False, coerce = True),           # Relative humidity
+                "relative_humidity": pa.Column(float, pa.Check.between(0, 100, n_failure_cases = self._MAX_FAILURE_CASES), nullable=True, required=False, coerce = True),           # Relative humidity
                 "wind_speed": pa.Column(float, nullable=True, required=False, coerce = True),         # Wind speed
                 "wind_gust": pa.Column(float, nullable=True, required=False, coerce = True),      # Max wind gust
                 "wind_direction": pa.Column(float, nullable = True, required = False, coerce = True),
                 "precipitation.+": pa.Column(float, nullable=True, required = False, regex = True, coerce = True),                        # Precipitation
-                "irrigation": pa.Column(float, nullable=True, required=False, coerce = True),         # Irrigation
+                "irrigation": pa.Column(pd.Int64Dtype(), nullable=True, required=False, coerce = True),         # Irrigation (on/off)
                 "leaf_wetness": pa.Column(float, nullable=True, required=False, coerce = True),           # Leaf wetness
                 "millsperiode_start": pa.Column(float, nullable=True, required=False, coerce = True),          # Beginn Millsperiode
-                "rain_start": pa.Column(pd.Timestamp, nullable=True, required=False),
+                "rain_start": pa.Column(pd.DatetimeTZDtype(tz="UTC"), nullable=True, required=False),
                 "air_pressure": pa.Column(float, nullable = True, required = False, coerce = True),
                 "sun_duration.+": pa.Column(float, nullable = True, required = False, regex = True, coerce = True),
                 "solar_radiation.+": pa.Column(float, nullable = True, required = False, regex = True, coerce = True),
-                "cloud_cover.+": pa.Column(float, pa.Check.between(0, 100), nullable = True, required = False, regex = True, coerce = True),
+                "cloud_cover.+": pa.Column(float, pa.Check.between(0, 100, n_failure_cases = self._MAX_FAILURE_CASES), nullable = True, required = False, regex = True, coerce = True),
                 "snow_height": pa.Column(float, nullable = True, required = False, coerce = True),
                 "water_level": pa.Column(float, nullable = True, required = False, coerce = True),
                 "discharge": pa.Column(float, nullable = True, required = False, coerce = True),
@@ -196,6 +245,52 @@ class BaseMeteoHandler(ABC):
             strict=False  # Allow additional columns that might be added
         )
 
+    def _validate_fast(self, df: pd.DataFrame) -> bool:
+        """
+        Check the data against the output schema using dtypes and vectorized checks only, without coercion.
+        
+        Args:
+            df (pd.DataFrame): Data to check
+            
+        Returns:
+            bool: True if the data already conforms to the schema. False if it needs the full pandera validation.
+        """
+        schema = self.output_schema
+
+        if not schema.index.dtype.check(pandas_engine.Engine.dtype(df.index.dtype)):
+            return False
+
+        for name, column in schema.columns.items():
+            if column.regex:
+                pattern = re.compile(name)
+                matched = [i for i in df.columns if isinstance(i, str) and pattern.fullmatch(i)]
+            else:
+                matched = [name] if name in df.columns else []
+
+            if not matched:
+                if column.required:
+                    return False
+                continue
+
+            for col in matched:
+                series = df[col]
+                if not column.dtype.check(pandas_engine.Engine.dtype(series.dtype)):
+                    return False
+                if not column.nullable and series.isna().any():
+                    return False
+                for check in column.checks:
+                    # Only range checks have a vectorized equivalent here
+                    if check.name != 'in_range':
+                        return False
+                    stats = check.statistics
+                    if ((series < stats['min_value']) | (series > stats['max_value'])).any():
+                        return False
+
+        if schema.unique and df.duplicated(subset = schema.unique).any():
+            return False
+
+        return True
+
     def validate(self, transformed_data: pd.DataFrame) -> pd.DataFrame:
         """
         Validate the transformed data against the output schema.
@@ -207,9 +302,20 @@ class BaseMeteoHandler(ABC):
             pd.DataFrame: Validated data
             
         Raises:
-            pa.errors.SchemaError: If validation fails
+            pa.errors.SchemaErrors: If validation fails. All failing checks are collected in one pass.
         """
-        return self.output_schema.validate(transformed_data)
+        if self.fast_validate and self._validate_fast(transformed_data):
+            return transformed_data
+
+        try:
+            return self.output_schema.validate(transformed_data, lazy = True)
+        except pa.errors.SchemaErrors as e:
+            failure_cases = e.failure_cases
+            logger.error(
+                f"Validation of {self.provider_name} data failed with {len(failure_cases)} failure cases. "
+                f"First {self._MAX_FAILURE_CASES}:\n{failure_cases.head(self._MAX_FAILURE_CASES)}"
+            )
+            raise
 
     async def run(self, drop_columns = False, **kwargs) -> pd.DataFrame | None:
         """
@@ -236,6 +342,6 @@ class BaseMeteoHandler(ABC):
         validated_data = self.validate(transformed_data)
 
         if drop_columns:
-            validated_data = validated_data[[i for i in validated_data.columns if i in self.output_schema.columns]]
+            validated_data = validated_data.loc[:, validated_data.columns.intersection(self.schema_columns)]
                     
         return validated_data
@@ -96,6 +96,7 @@ class ModelInfo:
 class GeoSphere(BaseMeteoHandler):
     provider_name = 'geosphere'
     can_forecast = True
+    supports_batch = True
 
     base_url = "https://dataset.api.hub.geosphere.at/v1/timeseries"
     timeseries_url = base_url + "/forecast"
@@ -138,10 +139,8 @@ class GeoSphere(BaseMeteoHandler):
         self.models = list(self.model_info.keys()) #remove models that failed and have no info
 
     async def __aenter__(self):
-        """Start httpx client that is reused across requests"""
-        logger.debug("Opening API session...")
-        self._client = httpx.AsyncClient(timeout = self.timeout)
-        await self._authenticate()
+        """Start httpx client on first use and load model info if missing"""
+        await super().__aenter__()
         if self.model_info is None:
             await self._get_model_info()
         return self
@@ -401,9 +400,8 @@ class GeoSphere(BaseMeteoHandler):
         df_renamed.rename(columns =_GEOSPHERE_RENAME, inplace = True)
 
         try:
-            df_renamed['datetime'] = pd.to_datetime(df_renamed['datetime'])
-            if df_renamed['datetime'].dt.tz is None:
-                df_renamed['datetime'] = df_renamed['datetime'].dt.tz_localize('UTC')
+            # Naive timestamps are taken as UTC, so parsing and localizing happen in one pass
+            df_renamed['datetime'] = pd.to_datetime(df_renamed['datetime'], format='ISO8601', utc=True)
             df_renamed['datetime'] = df_renamed['datetime'].dt.floor(freq)
         except Exception as e:
             logger.error(f"Error transforming datetime: {e}")
@@ -472,6 +470,7 @@ if __name__ == '__main__':
         geosphere = GeoSphere(timezone = 'Europe/Rome', locations = locations)
         async with geosphere as prv:
             data, _ = await prv.get_raw_data('bozen', models = ["nwp-v1-1h-2500m"])
+        await geosphere.aclose()
         
         transformed_data = geosphere.transform(data)
         validated_data = geosphere.validate(transformed_data)
@@ -36,6 +36,7 @@ class OpenMeteo(BaseMeteoHandler):
     
     provider_name = 'open-meteo'
     can_forecast = True
+    supports_batch = True
 
     base_url = "https://api.open-meteo.com/v1"
     timeseries_url = base_url + "/forecast"
@@ -212,7 +213,7 @@ class OpenMeteo(BaseMeteoHandler):
                 df_prepared[col] = df_prepared[col].astype(float)
 
         try:
-            df_prepared['datetime'] = pd.to_datetime(df_prepared['datetime']).dt.tz_localize(self.timezone)
+            df_prepared['datetime'] = pd.to_datetime(df_prepared['datetime'], format='ISO8601').dt.tz_localize(self.timezone)
             df_prepared['datetime'] = df_prepared['datetime'].dt.tz_convert('UTC')
             df_prepared['datetime'] = df_prepared['datetime'].dt.floor(self.get_freq())
         except Exception as e:
@@ -260,6 +261,7 @@ if __name__ == '__main__':
         open_meteo = OpenMeteo(timezone = 'Europe/Rome', locations = locations)
         async with open_meteo as prv:
             data, _ = await prv.get_raw_data('bozen', models = ['meteoswiss_icon_seamless', 'best_match'])
+        await open_meteo.aclose()
         
         transformed_data = open_meteo.transform(data)
         validated_data = open_meteo.validate(transformed_data)
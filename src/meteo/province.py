@@ -285,6 +285,7 @@ if __name__ == '__main__':
                 start = start,
                 end = end,
             )
+        await pr_handler.aclose()
         print(data)
         return data
 
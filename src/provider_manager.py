@@ -1,7 +1,7 @@
 from pathlib import Path
+import ast
 import importlib
 import pkgutil
-import inspect
 from typing import Dict, Type, Optional
 import logging
 
@@ -27,13 +27,17 @@ class ProviderManager:
             
         self.registry: Dict[str, Type] = {}
         self.providers: Dict[str, Type] = {}
+        self._lazy_registry: Dict[str, str] = {}
+        self._aliases: Dict[str, str] = {}
 
         self._discover_providers(ignore_modules)
         self._initialize_providers(provider_config)
     
     def _discover_providers(self, ignore_modules: list[str]):
         """
-        Discover and import all provider modules in the meteo package.
+        Discover all provider modules in the meteo package without importing them.
+        Provider names are read from the module source, the module itself is only
+        imported once one of its providers is requested.
         
         Args:
             ignore_modules: List of module names to ignore
@@ -45,16 +49,70 @@ class ProviderManager:
         if not meteo_dir.exists():
             raise ImportError(f"Meteo directory not found at {meteo_dir}")
         
-        # Import all modules in the meteo package
         meteo_package = 'src.meteo'
         
-        for _, module_name, _ in pkgutil.iter_modules([str(meteo_dir)]):
-            if module_name not in ignore_modules:
-                try:
-                    module = importlib.import_module(f'{meteo_package}.{module_name}')
-                    self._register_providers_from_module(module)
-                except ImportError as e:
-                    logger.warning(f"Warning: Could not import module {module_name}: {e}")
+        for _, module_name, is_pkg in pkgutil.iter_modules([str(meteo_dir)]):
+            if module_name in ignore_modules:
+                continue
+
+            module_path = f'{meteo_package}.{module_name}'
+            source_file = meteo_dir / module_name / '__init__.py' if is_pkg else meteo_dir / f'{module_name}.py'
+            try:
+                provider_names = self._scan_provider_names(source_file)
+            except (OSError, SyntaxError) as e:
+                logger.warning(f"Could not scan module {module_name} for providers ({e}). Importing it directly.")
+                self._import_provider_module(module_path)
+                continue
+
+            for provider_name in provider_names:
+                self._lazy_registry[provider_name] = module_path
+
+    @staticmethod
+    def _scan_provider_names(source_file: Path) -> list[str]:
+        """
+        Collect the provider_name string constants of all top level classes in a module source file.
+        
+        Args:
+            source_file: Path to the python source of the module
+            
+        Returns:
+            List of lowercased provider names
+        """
+        tree = ast.parse(source_file.read_text(encoding = 'utf-8'), filename = str(source_file))
+
+        provider_names = []
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef) or node.name == 'BaseMeteoHandler':
+                continue
+            for stmt in node.body:
+                if (isinstance(stmt, ast.Assign) and
+                    any(isinstance(t, ast.Name) and t.id == 'provider_name' for t in stmt.targets) and
+                    isinstance(stmt.value, ast.Constant) and isinstance(stmt.value.value, str)):
+                    provider_names.append(stmt.value.value.lower())
+        return provider_names
+
+    def _import_provider_module(self, module_path: str):
+        """
+        Import a provider module and register the providers it defines.
+        
+        Args:
+            module_path: Fully qualified name of the module
+        """
+        try:
+            module = importlib.import_module(module_path)
+            self._register_providers_from_module(module)
+        except ImportError as e:
+            logger.warning(f"Warning: Could not import module {module_path}: {e}")
+
+    def _get_provider_class(self, provider_name: str) -> Optional[Type]:
+        """
+        Get a registered provider class, importing its module on first use.
+        """
+        provider_class = self.registry.get(provider_name)
+        if provider_class is None and provider_name in self._lazy_registry:
+            self._import_provider_module(self._lazy_registry[provider_name])
+            provider_class = self.registry.get(provider_name)
+        return provider_class
     
     def _register_providers_from_module(self, module):
         """
@@ -63,7 +121,9 @@ class ProviderManager:
         Args:
             module: The imported module to scan for providers
         """
-        for name, obj in inspect.getmembers(module, inspect.isclass):
+        for name, obj in list(vars(module).items()):
+            if not isinstance(obj, type):
+                continue
             # Check if the class has a provider_name attribute and is not the base class
             if (hasattr(obj, 'provider_name') and 
                 obj.__module__ == module.__name__ and  # Only classes defined in this module
@@ -72,13 +132,18 @@ class ProviderManager:
                 self.registry[obj.provider_name.lower()] = obj
 
     def _initialize_providers(self, provider_config: Dict[str, Dict]) -> None:
-        for provider_name, provider_class in self.registry.items():
+        # Scanned providers plus any registered by a direct import fallback
+        for provider_name in dict.fromkeys([*self._lazy_registry, *self.registry]):
             config = provider_config.get(provider_name)
 
             if config is None:
                 logger.warning(f"No configuration found for Provider '{provider_name}'. Skipping.")
                 continue
 
+            provider_class = self._get_provider_class(provider_name)
+            if provider_class is None:
+                continue
+
             try:
                 self.providers[provider_name.lower()] = provider_class(**config)
                 logger.info(f"Initialized provider '{provider_name}'")
@@ -88,7 +153,7 @@ class ProviderManager:
     
     def get_provider(self, provider_name: str) -> Optional[Type]:
         """
-        Get a provider class by its name.
+        Get a provider class by its name. The lookup is case-insensitive.
         
         Args:
             provider_name: The name of the provider to retrieve
@@ -96,7 +161,23 @@ class ProviderManager:
         Returns:
             The provider class if found, None otherwise
         """
-        return self.providers.get(provider_name)
+        key = self._aliases.get(provider_name)
+        if key is None:
+            key = provider_name.lower()
+            # Only remember spellings of known providers, so arbitrary request input cannot grow the map
+            if key in self.providers:
+                self._aliases[provider_name] = key
+        return self.providers.get(key)
+    
+    async def aclose(self):
+        """
+        Close the http clients of all initialized providers.
+        """
+        for provider_name, provider in self.providers.items():
+            try:
+                await provider.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close provider '{provider_name}': {e}")
     
     def list_providers(self) -> list[str]:
         """
@@ -121,7 +202,7 @@ class ProviderManager:
         Raises:
             ValueError: If the provider is not found
         """
-        provider_class = self.registry.get(provider_name)
+        provider_class = self._get_provider_class(provider_name)
         if provider_class is None:
             raise ValueError(f"Provider '{provider_name}' not found. Available providers: {self.list_providers()}")
         
@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 
 import logging
 from datetime import datetime, timezone, timedelta
@@ -8,12 +9,19 @@ import asyncio
 from .database.db import MeteoDB
 from .meteo.base import BaseMeteoHandler
 from .gapfinder import Gapfinder
-from .utils import reindex_group, str_to_list
+from .utils import floor_to_freq, freq_to_timedelta, reindex_groups, same_timezone, str_to_list
 
 logger = logging.getLogger(__name__)
 
 class QueryManager:
     """Orchestrates data fetching from database and external providers."""
+
+    # Share of timestamps within the enclosing range of all gaps that has to be missing
+    # before the gaps are fetched with a single call, so cached data between sparse gaps is not downloaded again
+    _BATCH_MIN_DENSITY = 0.3
+
+    # Gaps of a non-batch provider that are at most this many frequency steps apart are fetched with one call
+    _COALESCE_MAX_STEPS = 4
     
     def __init__(self, max_concurrent_requests: int = 3, cache_lag_minutes: int = 0):
         self.gapfinder = Gapfinder()
@@ -37,9 +45,9 @@ class QueryManager:
             start_gap_ext, end_gap_ext = start_gap, end_gap
             provider_inclusion = provider_handler.inclusive
             if provider_inclusion == 'left' and is_last:
-                end_gap_ext = end_gap + pd.Timedelta(freq)
+                end_gap_ext = end_gap + freq_to_timedelta(freq)
             if provider_inclusion == 'right' and is_first:
-                start_gap_ext = start_gap - pd.Timedelta(freq)
+                start_gap_ext = start_gap - freq_to_timedelta(freq)
 
             async with self._semaphore:
                 provider_data = await provider_handler.run(
@@ -54,6 +62,60 @@ class QueryManager:
         except Exception as e:
             logger.exception(f"Error fetching data from {start_gap} to {end_gap} for {provider_handler.provider_name}: {e}")
             return None, start_gap, end_gap
+
+    async def _create_batch_fetch_task(
+        self,
+        station_id: str,
+        provider_handler: BaseMeteoHandler,
+        gaps: List[Tuple[datetime, datetime]],
+        models: list[str] | None,
+        freq: str
+    ) -> List[Tuple[pd.DataFrame | None, datetime, datetime]]:
+        """Fetch all gaps with one provider call over the enclosing range. Each gap is clipped from the shared result later on."""
+        batch_start = min(start_gap for start_gap, _ in gaps)
+        batch_end = max(end_gap for _, end_gap in gaps)
+        provider_data, _, _ = await self._create_fetch_task(
+            station_id, provider_handler, batch_start, batch_end, is_first = True, is_last = True, models = models, freq = freq
+        )
+        return [(provider_data, start_gap, end_gap) for start_gap, end_gap in gaps]
+
+    @classmethod
+    def _should_batch(cls, provider_handler: BaseMeteoHandler, gaps: List[Tuple[datetime, datetime]], freq: str) -> bool:
+        """
+        Decide whether gaps are fetched with one call over their enclosing range. This is the case for dense gaps,
+        which for non-batch providers also have to fit into a single request chunk of the provider.
+        """
+        supports_batch = getattr(provider_handler, 'supports_batch', False)
+        if len(gaps) < 2:
+            return supports_batch
+
+        batch_start = min(start_gap for start_gap, _ in gaps)
+        batch_end = max(end_gap for _, end_gap in gaps)
+        chunk_size_days = getattr(provider_handler, 'chunk_size_days', None)
+        if not supports_batch and chunk_size_days is not None and batch_end - batch_start > timedelta(days = chunk_size_days):
+            return False
+
+        freq_delta = freq_to_timedelta(freq)
+        gap_rows = sum((end_gap - start_gap) // freq_delta + 1 for start_gap, end_gap in gaps)
+        span_rows = (batch_end - batch_start) // freq_delta + 1
+        return gap_rows / span_rows >= cls._BATCH_MIN_DENSITY
+
+    @classmethod
+    def _coalesce_gaps(cls, gaps: List[Tuple[int, datetime, datetime]], freq: str) -> List[List[Tuple[int, datetime, datetime]]]:
+        """
+        Group sorted (position, start, end) gaps into runs whose neighbours are at most _COALESCE_MAX_STEPS steps apart.
+        """
+        max_distance = freq_to_timedelta(freq) * cls._COALESCE_MAX_STEPS
+        groups = [[gaps[0]]]
+        for gap in gaps[1:]:
+            if gap[1] - groups[-1][-1][2] <= max_distance:
+                groups[-1].append(gap)
+            else:
+                groups.append([gap])
+        return groups
+
+    async def _create_single_fetch_task(self, *args, **kwargs) -> List[Tuple[pd.DataFrame | None, datetime, datetime]]:
+        return [await self._create_fetch_task(*args, **kwargs)]
             
     async def _fetch_missing_data(
         self,
@@ -74,94 +136,102 @@ class QueryManager:
         n = len(gaps)
         if freq is None:
             freq = self._get_provider_freq(provider_handler, models)
-        async with provider_handler as prv:
-            tasks = []
-            for i, (start_gap, end_gap) in enumerate(gaps):
-                
-                if start_gap is None or end_gap is None:
-                    logger.warning("Found gap with start or end date missing. Skipping data fetch")
-                    continue
-
-                if start_gap >= end_gap:
-                    logger.warning(f"Start gap must be before end gap. Got {start_gap}-{end_gap}. Skipping data fetch")
-                    continue
-                
-                is_last = i == n - 1
-                is_first = i == 0
-
-                task = asyncio.create_task(
-                    self._create_fetch_task(station_id, prv, start_gap, end_gap, is_first, is_last, models = models, freq = freq)
-                )
 
-                tasks.append(task)
+        # Drop unusable gaps before entering the provider context, which may open connections or log in
+        valid_gaps = []
+        for i, (start_gap, end_gap) in enumerate(gaps):
+            
+            if start_gap is None or end_gap is None:
+                logger.warning("Found gap with start or end date missing. Skipping data fetch")
+                continue
 
-            for task in asyncio.as_completed(tasks):
-                try:
-                    provider_data, start_gap, end_gap = await task
-                    
-                    #Create daterange to make sure all requested timestamps are present in provider_data
-                    gap_index = pd.date_range(
-                        start=pd.Timestamp(start_gap),
-                        end=pd.Timestamp(end_gap),
-                        freq=freq,
-                        inclusive="both",
-                    )
-
-                    if provider_data is None or provider_data.empty:
-                        logger.warning(f"No data returned for {start_gap} - {end_gap}")
-
-                        if all_variables and len(gap_index) > 0:
-                            cache_models = models if models is not None else ['']
-                            for model in cache_models:
-                                placeholder = pd.DataFrame({
-                                    'datetime': gap_index,
-                                    'station_id': station_id,
-                                    'model': model
-                                })
-                                for column in all_variables:
-                                    placeholder[column] = pd.NA
-                                cache_data_all.append(placeholder)
-                        continue
+            if start_gap >= end_gap:
+                logger.warning(f"Start gap must be before end gap. Got {start_gap}-{end_gap}. Skipping data fetch")
+                continue
 
-                    provider_data = self._clip_to_range(provider_data, start_gap, end_gap)
+            valid_gaps.append((i, start_gap, end_gap))
 
-                    if provider_data.empty:
-                        logger.warning(f"No data left after clipping for {start_gap} - {end_gap}")
-                        continue
+        if not valid_gaps:
+            return pd.DataFrame(), pd.DataFrame()
 
-                    provider_data.drop_duplicates(subset = ['datetime', 'station_id', 'model'], inplace = True) #remove potential overlaps in data gaps
-                    response_data_all.append(provider_data.copy())
+        async with provider_handler as prv:
+            if self._should_batch(prv, [(s, e) for _, s, e in valid_gaps], freq):
+                tasks = [asyncio.create_task(
+                    self._create_batch_fetch_task(station_id, prv, [(s, e) for _, s, e in valid_gaps], models = models, freq = freq)
+                )]
+            else:
+                tasks = []
+                for group in self._coalesce_gaps(valid_gaps, freq):
+                    if len(group) > 1:
+                        task = self._create_batch_fetch_task(station_id, prv, [(s, e) for _, s, e in group], models = models, freq = freq)
+                    else:
+                        i, start_gap, end_gap = group[0]
+                        task = self._create_single_fetch_task(station_id, prv, start_gap, end_gap, i == 0, i == n - 1, models = models, freq = freq)
+                    tasks.append(asyncio.create_task(task))
+
+            for task in asyncio.as_completed(tasks):
+                for provider_data, start_gap, end_gap in await task:
+                    try:
+                        #Create daterange to make sure all requested timestamps are present in provider_data
+                        gap_index = pd.date_range(
+                            start=pd.Timestamp(start_gap),
+                            end=pd.Timestamp(end_gap),
+                            freq=freq,
+                            inclusive="both",
+                        )
+
+                        if provider_data is None or provider_data.empty:
+                            logger.warning(f"No data returned for {start_gap} - {end_gap}")
+
+                            if all_variables and len(gap_index) > 0:
+                                cache_models = models if models is not None else ['']
+                                for model in cache_models:
+                                    placeholder = pd.DataFrame({
+                                        'datetime': gap_index,
+                                        'station_id': station_id,
+                                        'model': model,
+                                        **dict.fromkeys(all_variables, pd.NA)
+                                    })
+                                    cache_data_all.append(placeholder)
+                            continue
+
+                        provider_data = self._clip_to_range(provider_data, start_gap, end_gap)
+
+                        if provider_data.empty:
+                            logger.warning(f"No data left after clipping for {start_gap} - {end_gap}")
+                            continue
+
+                        provider_data.drop_duplicates(subset = ['datetime', 'station_id', 'model'], inplace = True) #remove potential overlaps in data gaps
+                        # set_index below builds a new frame, so provider_data itself is never mutated and needs no copy
+                        response_data_all.append(provider_data)
                     
-                    ## Reindex to add missing timestamps
-                    provider_data_cache = (
-                        provider_data
-                        .set_index(['station_id', 'model', 'datetime'])
-                        .groupby(level=['station_id', 'model'], sort=False, group_keys=False)
-                        .apply(reindex_group, freq=freq, dt_start = gap_index.min(), dt_end = gap_index.max())
-                        .reset_index()
-                    )
-
-                    #Add missing variables
-                    for column in all_variables:
-                        if column not in provider_data_cache.columns:
-                            provider_data_cache[column] = pd.NA
-
-                    cache_data_all.append(provider_data_cache)
-                except Exception as e:
-                    logger.exception(
-                        f"Error processing data for {start_gap} - {end_gap} from {provider_handler.provider_name}: {e}"
-                    )
-                    continue
+                        ## Reindex to add missing timestamps
+                        provider_data_cache = reindex_groups(
+                            provider_data.set_index(['station_id', 'model', 'datetime']),
+                            gap_index
+                        ).reset_index()
+
+                        #Add missing variables in one go instead of inserting them column by column
+                        missing_variables = [column for column in all_variables if column not in provider_data_cache.columns]
+                        if missing_variables:
+                            provider_data_cache = provider_data_cache.assign(**dict.fromkeys(missing_variables, pd.NA))
+
+                        cache_data_all.append(provider_data_cache)
+                    except Exception as e:
+                        logger.exception(
+                            f"Error processing data for {start_gap} - {end_gap} from {provider_handler.provider_name}: {e}"
+                        )
+                        continue
         
         response_result = pd.DataFrame()
         cache_result = pd.DataFrame()
 
         if response_data_all:
-            response_result = pd.concat(response_data_all, ignore_index=True)
+            response_result = pd.concat(response_data_all, ignore_index=True, copy=False)
             response_result.sort_values('datetime', inplace=True)
 
         if cache_data_all:
-            cache_result = pd.concat(cache_data_all, ignore_index=True)
+            cache_result = pd.concat(cache_data_all, ignore_index=True, copy=False)
             cache_result.sort_values('datetime', inplace=True)
 
         return response_result, cache_result
@@ -232,12 +302,16 @@ class QueryManager:
         else:
             existing_data = pd.DataFrame()
 
-        if not existing_data.empty:
+        # min/max scan the whole column, so only compute them when the message is actually logged
+        if not existing_data.empty and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Found existing data {existing_data.datetime.min():%Y-%m-%d %H:%M:%S} - {existing_data.datetime.max():%Y-%m-%d %H:%M:%S} (UTC)")
                         
         # Find gaps in the data
         dt_index = pd.DatetimeIndex(existing_data['datetime']) if not existing_data.empty else pd.DatetimeIndex([])
-        gaps = self.gapfinder.find_data_gaps(dt_index, start_time_round, end_time_round, freq = freq)
+        if self._covers_range(dt_index, start_time_round, end_time_round, freq):
+            gaps = []
+        else:
+            gaps = self.gapfinder.find_data_gaps(dt_index, start_time_round, end_time_round, freq = freq)
         
         if not gaps:
             logger.debug("No data gaps found")
@@ -266,6 +340,22 @@ class QueryManager:
             return provider_handler.get_freq(models)
         return provider_handler.freq
 
+    @staticmethod
+    def _covers_range(dt_index: pd.DatetimeIndex, start: datetime, end: datetime, freq: str) -> bool:
+        """
+        Cheap check whether cached timestamps already fill the whole rounded range, so gap detection can be skipped.
+        """
+        if dt_index.empty:
+            return False
+
+        freq_delta = freq_to_timedelta(freq)
+        expected_len = (pd.Timestamp(end) - pd.Timestamp(start)) // freq_delta + 1
+        if len(dt_index) != expected_len or dt_index[0] != start or dt_index[-1] != end:
+            return False
+
+        # Exactly one step between all neighbours, which also rules out duplicates and unsorted data
+        return bool(np.all(np.diff(dt_index.as_unit('ns').asi8) == freq_delta.value))
+
     @staticmethod
     def _clip_to_range(df: pd.DataFrame, start: datetime, end: datetime) -> pd.DataFrame:
         if df is None or df.empty:
@@ -308,15 +398,15 @@ class QueryManager:
     @staticmethod
     def _round_range_to_freq(start_time: datetime, end_time: datetime, freq: str, forecast: bool = False):
         # Floor the start to ensure we cover the interval
-        start_time_round = pd.Timestamp(start_time).floor(freq)
+        start_time_round = floor_to_freq(start_time, freq)
         
         # Floor the end to ensure we only query complete timestamps
-        end_time_round = pd.Timestamp(end_time).floor(freq)
+        end_time_round = floor_to_freq(end_time, freq)
         
         # Ensure we don't query the future
         if not forecast:
             now_utc = datetime.now(timezone.utc)
-            now_floor = pd.Timestamp(now_utc).floor(freq)
+            now_floor = floor_to_freq(now_utc, freq)
             if end_time_round > now_floor:
                 logger.debug(f"Requested end time is in the future. Capping at {now_floor} (UTC)")
                 end_time_round = now_floor
@@ -332,6 +422,10 @@ class QueryManager:
         if existing_data.empty:
             return new_data
 
+        if new_data.empty:
+            # Cached rows come from a pivot and are already unique per key, only the order has to match
+            return existing_data.sort_values(['datetime', 'station_id', 'model'])
+
         existing_tz = None
         if not existing_data.empty:
             existing_tz = existing_data.datetime.dt.tz
@@ -343,9 +437,10 @@ class QueryManager:
             if existing_tz != new_tz:
                 raise ValueError(f"Cannot concat data with different timezones. Got existing_data: {existing_tz} vs new_data: {new_tz}")
 
-        combined = pd.concat([existing_data, new_data])
-        combined = combined.drop_duplicates(subset=['station_id', 'datetime', 'model'])
-        combined = combined.sort_values(['datetime', 'station_id', 'model'])
+        # The concatenated frame is owned here, so deduplicate and sort it in place instead of copying it twice more
+        combined = pd.concat([existing_data, new_data], copy=False)
+        combined.drop_duplicates(subset=['station_id', 'datetime', 'model'], inplace=True)
+        combined.sort_values(['datetime', 'station_id', 'model'], inplace=True)
         
         return combined
 
@@ -356,7 +451,8 @@ class QueryManager:
             if combined_data['datetime'].dt.tz is None:
                 logger.warning("Timestamps of combined data are timezone naive. Localizing to UTC")
                 combined_data['datetime'] =  combined_data['datetime'].dt.tz_localize(timezone.utc)
-            combined_data['datetime'] = combined_data['datetime'].dt.tz_convert(target_tz)
+            if not same_timezone(combined_data['datetime'].dt.tz, target_tz):
+                combined_data['datetime'] = combined_data['datetime'].dt.tz_convert(target_tz)
         else:
             combined_data = pd.DataFrame()
 
@@ -364,7 +460,8 @@ class QueryManager:
             if new_data['datetime'].dt.tz is None:
                 logger.warning("Timestamps of new data are timezone naive. Localizing to UTC")
                 new_data['datetime'] =  new_data['datetime'].dt.tz_localize(timezone.utc)
-            new_data['datetime'] = new_data['datetime'].dt.tz_convert(target_tz)
+            if not same_timezone(new_data['datetime'].dt.tz, target_tz):
+                new_data['datetime'] = new_data['datetime'].dt.tz_convert(target_tz)
         else:
             new_data = pd.DataFrame()
 
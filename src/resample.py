@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 
 import logging
 import functools
@@ -42,6 +43,9 @@ class ColumnResampler:
 
     _QUANTILE_SUFFIX_PATTERN = re.compile(r"_p\d+$")
 
+    # Weather codes up to this value are counted with np.bincount instead of a hash based Series.mode
+    _BINCOUNT_MAX_CODE = 1000
+
     def __init__(
         self,
         resample_colmap: dict[str, str | Callable | list[str | Callable] | tuple[str | Callable, ...]] | None = None,
@@ -147,6 +151,13 @@ class ColumnResampler:
             if s.empty:
                 return pd.NA
 
+        if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s):
+            codes = s.to_numpy(dtype="float64")
+            if codes.min() >= 0 and codes.max() <= self._BINCOUNT_MAX_CODE and np.all(codes == np.floor(codes)):
+                # argmax picks the smallest of tied codes, like Series.mode().iloc[0]
+                mode_code = np.bincount(codes.astype(np.int64)).argmax()
+                return s.iloc[np.flatnonzero(codes == mode_code)[0]]
+
         mode_vals = s.mode()
         if mode_vals.empty:
             return pd.NA
@@ -183,6 +194,28 @@ class ColumnResampler:
         
         return named_aggs
 
+    @staticmethod
+    def _aggregate(grouped, named_aggs: dict[str, tuple[str, Any]]) -> pd.DataFrame:
+        """
+        Aggregate all columns sharing a string aggregation in one cythonized call, callables via named aggregation.
+        """
+        columns_by_func: dict[str, dict[str, str]] = {}
+        callable_aggs = {}
+        for out_col, (src_col, func) in named_aggs.items():
+            if isinstance(func, str):
+                columns_by_func.setdefault(func, {})[src_col] = out_col
+            else:
+                callable_aggs[out_col] = (src_col, func)
+
+        parts = [
+            grouped[list(columns)].agg(func).rename(columns=columns)
+            for func, columns in columns_by_func.items()
+        ]
+        if callable_aggs:
+            parts.append(grouped.agg(**callable_aggs))
+
+        return pd.concat(parts, axis=1)[list(named_aggs)]
+
     def apply_resampling(
         self,
         data: pd.DataFrame,
@@ -212,7 +245,7 @@ class ColumnResampler:
         
         if data.empty:
             return data.copy()
-        df = data.copy()
+        df = data
 
         required_cols = [datetime_col] + groupby_cols
         missing_required = [c for c in required_cols if c not in df.columns]
@@ -220,8 +253,9 @@ class ColumnResampler:
             raise ValueError(f"Cannot resample without required columns: {missing_required}")
 
         # 2. Data Preparation
+        # assign and dropna return new frames, so the caller's data is never modified and needs no copy
         if not pd.api.types.is_datetime64_any_dtype(df[datetime_col]):
-            df[datetime_col] = pd.to_datetime(df[datetime_col], errors="coerce")
+            df = df.assign(**{datetime_col: pd.to_datetime(df[datetime_col], errors="coerce")})
         df = df.dropna(subset=[datetime_col])
 
         # 3. Build Named Aggregations
@@ -234,12 +268,13 @@ class ColumnResampler:
         # 4. Perform Resampling
         # We use pd.Grouper inside groupby to handle everything in one go
         grouper = [pd.Grouper(key=datetime_col, freq=freq)] + groupby_cols
-        resampled = df.groupby(grouper, dropna=False).agg(**named_aggs)
+        grouped = df.groupby(grouper, dropna=False)
+        resampled = self._aggregate(grouped, named_aggs)
 
         # 5. Handle Min Sample Size (Efficiently)
         if min_samples > 1:
             # Count non-NA values for the original columns
-            counts = df.groupby(grouper, dropna=False)[value_cols].count()
+            counts = grouped[value_cols].count()
             
             # For every new column, mask it based on the count of its source column
             for out_col, (src_col, _) in named_aggs.items():
@@ -89,9 +89,11 @@ class RuntimeContext:
         )
        
 
-    def update_runtime(self, config_file: str | Path):
+    async def update_runtime(self, config_file: str | Path):
         self.config_file = Path(config_file)
         self.config = load_config_file(self.config_file)
+        # Provider clients stay open across requests, so the pools of the replaced providers have to be closed here
+        await self.provider_manager.aclose()
         self.initialize_runtime(self.config)
 
 if __name__ == '__main__':
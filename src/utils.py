@@ -1,10 +1,43 @@
 import pandas as pd
+import numpy as np
+from pandas.tseries.frequencies import to_offset
 
 import datetime
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=32)
+def freq_to_offset(freq: str):
+    """
+    Parse a frequency string (e.g. '1h', '10min') into a DateOffset.
+    Cached, as every provider only uses a handful of fixed frequencies.
+    """
+    return to_offset(freq)
+
+@functools.lru_cache(maxsize=32)
+def freq_to_timedelta(freq: str) -> pd.Timedelta:
+    """
+    Parse a frequency string (e.g. '1h', '10min') into a Timedelta.
+    Built from the offset in ns, as adding a Timedelta with a coarser unit (e.g. 's', returned for offsets) to a datetime
+    is a no-op and pandas 3 no longer converts Day offsets to a Timedelta.
+    """
+    return pd.Timedelta(freq_to_offset(freq).nanos, unit='ns')
+
+def floor_to_freq(ts, freq: str) -> pd.Timestamp:
+    """
+    Floor a timestamp to the given frequency, skipping the floor call if it is already aligned.
+    Like Timestamp.floor, alignment is checked on the local wall time of tz-aware timestamps.
+    """
+    ts = pd.Timestamp(ts)
+    local_ns = ts.value
+    if ts.tz is not None:
+        local_ns += ts.utcoffset() // pd.Timedelta(1, 'ns')
+    if local_ns % freq_to_timedelta(freq).value == 0:
+        return ts
+    return ts.floor(freq_to_offset(freq))
+
 def split_dates(start_date, end_date, freq, n_days=7, split_on_year=False):
     """
     freq: string (e.g., '1h', '15min') or pd.Timedelta
@@ -13,7 +46,7 @@ def split_dates(start_date, end_date, freq, n_days=7, split_on_year=False):
         raise ValueError(f"Start date cannot be smaller than end date. Got {start_date} and {end_date}")
 
     # Convert freq to a Timedelta for easy math
-    freq_delta = pd.Timedelta(freq)
+    freq_delta = freq.as_unit('ns') if isinstance(freq, pd.Timedelta) else freq_to_timedelta(freq)
     date_pairs = []
     current_start = start_date
     
@@ -48,28 +81,36 @@ def split_dates(start_date, end_date, freq, n_days=7, split_on_year=False):
     
     return date_pairs
 
-def reindex_group(
-    g: pd.DataFrame,
-    freq: str,
-    dt_start: datetime.datetime | None = None,
-    dt_end: datetime.datetime | None = None,
-) -> pd.DataFrame:
-    dt = g.index.get_level_values("datetime")
-
-    if dt_start is None:
-        dt_start = dt.min()
-    if dt_end is None:
-        dt_end = dt.max()
-
-    full = pd.date_range(dt_start, dt_end, freq=freq, name="datetime")
+def reindex_groups(df: pd.DataFrame, dt_index: pd.DatetimeIndex) -> pd.DataFrame:
+    """
+    Reindex every station_id/model group of a frame indexed by (station_id, model, datetime) to the timestamps in dt_index.
+    The full index is built from integer positions in one go, so no per-group reindex and no Timestamp boxing is needed.
+    """
+    keys = df.index.droplevel("datetime").unique()
+    n_keys, n_dt = len(keys), len(dt_index)
 
-    station_id = g.index.get_level_values("station_id")[0]
-    model = g.index.get_level_values("model")[0]
-    full_index = pd.MultiIndex.from_product(
-        [[station_id], [model], full],
+    key_pos = np.repeat(np.arange(n_keys), n_dt)
+    dt_pos = np.tile(np.arange(n_dt), n_keys)
+    full_index = pd.MultiIndex.from_arrays(
+        [
+            keys.get_level_values("station_id")[key_pos],
+            keys.get_level_values("model")[key_pos],
+            dt_index[dt_pos].rename("datetime"),
+        ],
         names=["station_id", "model", "datetime"],
     )
-    return g.reindex(full_index)
+    return df.reindex(full_index)
+
+def same_timezone(tz_a, tz_b) -> bool:
+    """
+    Check if two tzinfo objects denote the same zone, so tz_convert between them can be skipped.
+    Different implementations of the same zone (pytz, zoneinfo, datetime.timezone.utc) compare by name.
+    """
+    if tz_a is tz_b:
+        return True
+    if tz_a is None or tz_b is None:
+        return False
+    return str(tz_a) == str(tz_b)
 
 def str_to_list(x):
     if isinstance(x, str):
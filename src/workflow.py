@@ -5,6 +5,7 @@ import logging
 import asyncio
 
 from .runtime import RuntimeContext
+from .meteo.base import BaseMeteoHandler
 from .validation import TimeseriesQuery, TimeseriesResponse, ResponseMetadata
 
 logger = logging.getLogger(__name__)
@@ -40,6 +41,7 @@ class QueryWorkflow:
         latest: bool = False,
         agg: str | None = None,
         min_size: int | None = None,
+        provider_handler: BaseMeteoHandler | None = None,
     ):
         if latest and agg is not None:
             raise HTTPException(status_code=400, detail="Aggregation is not supported for latest queries.")
@@ -48,7 +50,9 @@ class QueryWorkflow:
         tz = pytz.timezone(tz_name)
         query.timezone = tz_name
 
-        provider_handler = self.runtime.provider_manager.get_provider(query.provider.lower())
+        # Callers that already resolved the provider pass it in to avoid a second lookup
+        if provider_handler is None:
+            provider_handler = self.runtime.provider_manager.get_provider(query.provider)
 
         if provider_handler is None:
             raise ValueError(f"Unknow provider {query.provider}. Choose one of {self.runtime.provider_manager.list_providers()}")
@@ -0,0 +1,5 @@
+from datetime import datetime, timezone
+
+
+def dt_utc(year, month, day, hour=0, minute=0, second=0):
+    return datetime(year, month, day, hour, minute, second, tzinfo=timezone.utc)
@@ -0,0 +1,94 @@
+import pandas as pd
+import pytest
+
+from src.gapfinder import Gapfinder
+from tests.helpers import dt_utc
+
+
+@pytest.fixture()
+def gapfinder():
+    return Gapfinder()
+
+
+def test_find_data_gaps_returns_missing_ranges(gapfinder):
+    complete = pd.date_range(dt_utc(2025, 1, 1, 0), dt_utc(2025, 1, 1, 10), freq="1h")
+    existing = complete.delete([2, 3, 7])
+
+    gaps = gapfinder.find_data_gaps(
+        existing, dt_utc(2025, 1, 1, 0), dt_utc(2025, 1, 1, 10), freq="1h", min_gap_duration="1h"
+    )
+
+    assert gaps == [
+        (dt_utc(2025, 1, 1, 2), dt_utc(2025, 1, 1, 3)),
+        (dt_utc(2025, 1, 1, 7), dt_utc(2025, 1, 1, 7)),
+    ]
+
+
+def test_find_data_gaps_handles_unsorted_and_duplicate_existing_dates(gapfinder):
+    complete = pd.date_range(dt_utc(2025, 1, 1, 0), dt_utc(2025, 1, 1, 10), freq="1h")
+    existing = complete.delete([2, 3, 7])
+    shuffled = existing[::-1].append(existing[:2])
+
+    kwargs = dict(start=dt_utc(2025, 1, 1, 0), end=dt_utc(2025, 1, 1, 10), freq="1h", min_gap_duration="1h")
+
+    assert gapfinder.find_data_gaps(shuffled, **kwargs) == gapfinder.find_data_gaps(existing, **kwargs)
+
+
+def test_find_data_gaps_drops_gaps_shorter_than_min_duration(gapfinder):
+    complete = pd.date_range(dt_utc(2025, 1, 1, 0), dt_utc(2025, 1, 1, 2), freq="10min")
+    existing = complete.delete([3])
+
+    gaps = gapfinder.find_data_gaps(
+        existing, dt_utc(2025, 1, 1, 0), dt_utc(2025, 1, 1, 2), freq="10min", min_gap_duration="30min"
+    )
+
+    assert gaps == []
+
+
+@pytest.mark.parametrize(
+    ("min_gap_duration", "expected"),
+    [
+        ("0", [(dt_utc(2025, 1, 3), dt_utc(2025, 1, 3))]),
+        ("2 days", []),
+    ],
+)
+def test_find_data_gaps_accepts_timedelta_strings(gapfinder, min_gap_duration, expected):
+    complete = pd.date_range(dt_utc(2025, 1, 1), dt_utc(2025, 1, 5), freq="1D")
+    existing = complete.delete([2])
+
+    gaps = gapfinder.find_data_gaps(
+        existing, dt_utc(2025, 1, 1), dt_utc(2025, 1, 5), freq="1D", min_gap_duration=min_gap_duration
+    )
+
+    assert gaps == expected
+
+def test_find_data_gaps_aligns_existing_timezone(gapfinder):
+    complete = pd.date_range(dt_utc(2025, 1, 1, 0), dt_utc(2025, 1, 1, 5), freq="1h")
+    existing = complete.delete([4]).tz_convert("Europe/Rome")
+
+    gaps = gapfinder.find_data_gaps(
+        existing, dt_utc(2025, 1, 1, 0), dt_utc(2025, 1, 1, 5), freq="1h", min_gap_duration="1h"
+    )
+
+    assert gaps == [(dt_utc(2025, 1, 1, 4), dt_utc(2025, 1, 1, 4))]
+
+
+def test_find_data_gaps_full_range_when_no_existing_dates(gapfinder):
+    existing = pd.DatetimeIndex([], tz="UTC")
+
+    gaps = gapfinder.find_data_gaps(existing, dt_utc(2025, 1, 1, 0), dt_utc(2025, 1, 1, 3), freq="1h")
+
+    assert gaps == [(pd.Timestamp(dt_utc(2025, 1, 1, 0)), pd.Timestamp(dt_utc(2025, 1, 1, 3)))]
+
+
+def test_derive_datetime_gaps_groups_consecutive_timestamps(gapfinder):
+    timestamps = [dt_utc(2025, 1, 1, h) for h in [5, 1, 2, 3, 9, 10]]
+
+    gaps = gapfinder.derive_datetime_gaps(timestamps, freq="1h")
+
+    assert gaps == [
+        (dt_utc(2025, 1, 1, 1), dt_utc(2025, 1, 1, 3)),
+        (dt_utc(2025, 1, 1, 5), dt_utc(2025, 1, 1, 5)),
+        (dt_utc(2025, 1, 1, 9), dt_utc(2025, 1, 1, 10)),
+    ]
+    assert gapfinder.derive_datetime_gaps([], freq="1h") == []
@@ -5,10 +5,7 @@ import pandas as pd
 import pytest
 
 from src.query_manager import QueryManager
-
-
-def dt_utc(year, month, day, hour=0, minute=0, second=0):
-    return datetime(year, month, day, hour, minute, second, tzinfo=timezone.utc)
+from tests.helpers import dt_utc
 
 
 def make_existing_df(index, station_id="STATION_1", model=""):
@@ -211,3 +208,124 @@ async def test_get_data_rejects_multiple_models(manager, provider):
             end_time=end_time,
             models=["m1", "m2"],
         )
+
+
+@pytest.mark.asyncio
+async def test_get_data_skips_fetch_when_cache_covers_range(manager, provider):
+    start_time = dt_utc(2025, 1, 1, 0)
+    end_time = dt_utc(2025, 1, 1, 3)
+    full_range = pd.date_range(start=start_time, end=end_time, freq=provider.freq, inclusive="both")
+    db = FakeDB(make_existing_df(full_range).rename(columns={"index": "datetime"}))
+
+    with patch.object(manager.gapfinder, "find_data_gaps", wraps=manager.gapfinder.find_data_gaps) as find_gaps:
+        combined, pending = await manager.get_data(
+            db=db,
+            provider_handler=provider,
+            station_id="STATION_1",
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    assert len(combined) == len(full_range)
+    assert pending.empty
+    find_gaps.assert_not_called()
+    provider.run.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_data_fetches_all_gaps_in_one_call_for_batch_provider(manager, provider):
+    provider.supports_batch = True
+    start_time = dt_utc(2025, 1, 1, 0)
+    end_time = dt_utc(2025, 1, 1, 6)
+    full_range = pd.date_range(start=start_time, end=end_time, freq=provider.freq, inclusive="both")
+    db = FakeDB(make_existing_df(full_range[[0, 3, 6]]).rename(columns={"index": "datetime"}))
+
+    combined, pending = await manager.get_data(
+        db=db,
+        provider_handler=provider,
+        station_id="STATION_1",
+        start_time=start_time,
+        end_time=end_time,
+    )
+
+    provider.run.assert_called_once()
+    assert list(combined["datetime"]) == list(full_range)
+    assert list(pending["datetime"]) == list(full_range[[1, 2, 4, 5]])
+
+
+@pytest.mark.asyncio
+async def test_get_data_batches_dense_gaps_for_non_batch_provider(manager, provider):
+    start_time = dt_utc(2025, 1, 1, 0)
+    end_time = dt_utc(2025, 1, 1, 6)
+    full_range = pd.date_range(start=start_time, end=end_time, freq=provider.freq, inclusive="both")
+    db = FakeDB(make_existing_df(full_range[[0, 3, 6]]).rename(columns={"index": "datetime"}))
+
+    combined, pending = await manager.get_data(
+        db=db,
+        provider_handler=provider,
+        station_id="STATION_1",
+        start_time=start_time,
+        end_time=end_time,
+    )
+
+    provider.run.assert_called_once()
+    assert list(combined["datetime"]) == list(full_range)
+    assert list(pending["datetime"]) == list(full_range[[1, 2, 4, 5]])
+
+
+def test_should_batch_skips_sparse_gaps(manager, provider):
+    gaps = [
+        (dt_utc(2025, 1, 1, 1), dt_utc(2025, 1, 1, 2)),
+        (dt_utc(2025, 1, 2, 1), dt_utc(2025, 1, 2, 2)),
+    ]
+
+    assert not manager._should_batch(provider, gaps, provider.freq)
+
+
+def test_should_batch_skips_sparse_gaps_for_batch_provider(manager, provider):
+    provider.supports_batch = True
+    gaps = [
+        (dt_utc(2025, 1, 1, 1), dt_utc(2025, 1, 1, 2)),
+        (dt_utc(2025, 1, 31, 1), dt_utc(2025, 1, 31, 2)),
+    ]
+
+    assert not manager._should_batch(provider, gaps, provider.freq)
+
+
+@pytest.mark.asyncio
+async def test_get_data_fetches_sparse_gaps_separately_for_batch_provider(manager, provider):
+    provider.supports_batch = True
+    start_time = dt_utc(2025, 1, 1, 0)
+    end_time = dt_utc(2025, 1, 31, 0)
+    full_range = pd.date_range(start=start_time, end=end_time, freq=provider.freq, inclusive="both")
+    db = FakeDB(make_existing_df(full_range[2:-2]).rename(columns={"index": "datetime"}))
+
+    combined, pending = await manager.get_data(
+        db=db,
+        provider_handler=provider,
+        station_id="STATION_1",
+        start_time=start_time,
+        end_time=end_time,
+    )
+
+    assert provider.run.call_count == 2
+    assert list(pending["datetime"]) == list(full_range[[0, 1, -2, -1]])
+
+def test_covers_range_rejects_duplicates_with_matching_length(manager):
+    start, end = pd.Timestamp(dt_utc(2025, 1, 1, 0)), pd.Timestamp(dt_utc(2025, 1, 1, 3))
+    full_range = pd.date_range(start, end, freq="1h")
+
+    assert manager._covers_range(full_range, start, end, "1h")
+    assert not manager._covers_range(full_range[[0, 1, 1, 3]], start, end, "1h")
+
+
+def test_coalesce_gaps_merges_close_gaps_only(manager):
+    gaps = [
+        (0, dt_utc(2025, 1, 1, 0), dt_utc(2025, 1, 1, 1)),
+        (1, dt_utc(2025, 1, 1, 4), dt_utc(2025, 1, 1, 5)),
+        (2, dt_utc(2025, 1, 2, 0), dt_utc(2025, 1, 2, 1)),
+    ]
+
+    groups = manager._coalesce_gaps(gaps, "1h")
+
+    assert groups == [gaps[:2], gaps[2:]]
@@ -10,6 +10,7 @@ gaps/placeholder rows behave as expected before deploying to production.
 """
 
 import pytest
+import pytest_asyncio
 from datetime import datetime, timedelta
 import numpy as np
 
@@ -71,13 +72,14 @@ _SBR_TEST_STATIONS = ["103", "113", "96"] #, "137", "140", "12"]
 _OPENMETEO_TEST_MODELS = ["italia_meteo_arpae_icon_2i", "meteoswiss_icon_seamless", "meteofrance_seamless"]
 _GEOSPHERE_TEST_MODELS = ["nowcast-v1-15min-1km", "ensemble-v1-1h-2500m", "nwp-v1-1h-2500m"]
 
-@pytest.fixture
-def runtime(tmp_path):
+@pytest_asyncio.fixture
+async def runtime(tmp_path):
     config = load_config_file("config/config.yaml")
     db_path = tmp_path / "test.db"
     config.setdefault("database", {})["path"] = f"sqlite:///{db_path}"
     runtime_ctx = RuntimeContext(config=config, config_file="config/config.yaml")
     yield runtime_ctx
+    await runtime_ctx.provider_manager.aclose()
     runtime_ctx.db.close()
 
 @pytest.fixture
@@ -0,0 +1,85 @@
+import httpx
+import pandas as pd
+import pytest
+
+from src.meteo.SBR import SBRMeteo
+from tests.helpers import dt_utc
+
+
+LOGIN_PAGE = "<html><form>Benutzername Passwort <a>Logindaten vergessen?</a></form></html>"
+DATASET_PAGE = (
+    '<script>let dataSetOnLoad = prepareDataset([[{"x": 1735693200, "stationId": "3", "mg4": 1.5}]]);</script>'
+)
+
+
+@pytest.fixture()
+def handler():
+    return SBRMeteo(username="user", password="secret", timezone="Europe/Rome", sleep_time=0)
+
+
+def make_client(data_pages: list[str], requests: list[str]) -> httpx.AsyncClient:
+    def respond(request: httpx.Request) -> httpx.Response:
+        requests.append(request.method)
+        if request.method == "POST":
+            return httpx.Response(200, text="<html>Willkommen</html>")
+        return httpx.Response(200, text=data_pages.pop(0))
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(respond))
+
+
+@pytest.mark.asyncio
+async def test_get_raw_data_logs_in_again_when_session_expired(handler):
+    requests = []
+    handler._client = make_client([LOGIN_PAGE, DATASET_PAGE], requests)
+
+    data, _ = await handler.get_raw_data("3", dt_utc(2025, 1, 1, 0), dt_utc(2025, 1, 1, 1))
+
+    assert requests == ["POST", "GET", "POST", "GET"]
+    assert data is not None and len(data) == 1
+    assert data["Datum"].iloc[0] == pd.Timestamp("2025-01-01 01:00", tz="UTC")
+    await handler.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_raw_data_keeps_valid_session(handler):
+    requests = []
+    handler._client = make_client([DATASET_PAGE], requests)
+
+    data, _ = await handler.get_raw_data("3", dt_utc(2025, 1, 1, 0), dt_utc(2025, 1, 1, 1))
+
+    assert requests == ["POST", "GET"]
+    assert data is not None and len(data) == 1
+    assert data["Datum"].iloc[0] == pd.Timestamp("2025-01-01 01:00", tz="UTC")
+    await handler.aclose()
+
+
+def test_epoch_to_utc_coerces_out_of_range_values():
+    values = pd.Series([1735693200, 1735693200000, None, "invalid"])
+
+    result = SBRMeteo._epoch_to_utc(values)
+
+    assert result[0] == pd.Timestamp("2025-01-01 01:00", tz="UTC")
+    assert result[1:].isna().all()
+
+
+def test_validate_coerces_float_irrigation(handler):
+    data = pd.DataFrame(
+        {
+            "datetime": pd.DatetimeIndex([dt_utc(2025, 1, 1, 0), dt_utc(2025, 1, 1, 1)]).as_unit("ns"),
+            "station_id": "3",
+            "model": "",
+            "irrigation": [1.0, None],
+        }
+    )
+
+    validated = handler.validate(data)
+
+    assert validated["irrigation"].dtype == pd.Int64Dtype()
+    assert validated["irrigation"].tolist() == [1, pd.NA]
+
+
+def test_assign_dtype_nulls_non_integral_on_off_values(handler):
+    result = handler._assign_dtype(pd.DataFrame({"mg10": [1.0, 0.5, 0.0]}))
+
+    assert result["mg10"].dtype == pd.Int64Dtype()
+    assert result["mg10"].tolist() == [1, pd.NA, 0]
@@ -0,0 +1,29 @@
+import pandas as pd
+import pytest
+
+from src.utils import freq_to_timedelta, split_dates
+from tests.helpers import dt_utc
+
+
+def test_freq_to_timedelta_shifts_datetime():
+    assert dt_utc(2025, 1, 1, 1) + freq_to_timedelta("5min") == dt_utc(2025, 1, 1, 1, 5)
+
+
+@pytest.mark.parametrize(("freq", "expected"), [("D", pd.Timedelta(days=1)), ("1h", pd.Timedelta(hours=1))])
+def test_freq_to_timedelta_parses_frequencies(freq, expected):
+    assert freq_to_timedelta(freq) == expected
+
+
+def test_split_dates_advances_by_freq():
+    pairs = split_dates(dt_utc(2025, 1, 1), dt_utc(2025, 1, 10), "5min")
+
+    assert pairs == [
+        (dt_utc(2025, 1, 1), dt_utc(2025, 1, 7, 23, 55)),
+        (dt_utc(2025, 1, 8), dt_utc(2025, 1, 10)),
+    ]
+
+
+def test_split_dates_accepts_timedelta_freq():
+    pairs = split_dates(dt_utc(2025, 1, 1), dt_utc(2025, 1, 1, 1), pd.Timedelta(1, "h").as_unit("s"), n_days=1)
+
+    assert pairs == [(dt_utc(2025, 1, 1), dt_utc(2025, 1, 1, 1))]